@@ -0,0 +1,420 @@
+"""Terminal mini-games and the pop quiz for the file manager menu.
+
+Kept out of print.py so they are only imported when picked from the menu.
+"""
+import os
+import sys
+import random
+import time
+
+# Pacman cell values (the grid is a bytearray)
+WALL, DOT, EMPTY = ord('#'), ord('.'), ord(' ')
+PLAYER, GHOST = ord('P'), ord('G')
+# ghost steps: up, down, left, right, stay
+GHOST_MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1), (0, 0))
+
+# Mario runner cell values (the track line is a bytearray)
+OBSTACLE, MARIO, MARIO_AIR = ord('|'), ord('M'), ord('m')
+
+
+def prompt(message: str) -> str:
+    """Lighter input() for game loops: write the prompt and read one line from stdin."""
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+# Clear the terminal between game frames; on POSIX an ANSI escape avoids
+# spawning a `clear` subprocess every frame
+if os.name == 'nt':
+    def clear_screen():
+        os.system('cls')
+else:
+    def clear_screen():
+        sys.stdout.write("\x1b[H\x1b[2J")
+
+
+def run_pacman():
+    """A tiny, terminal-based Pacman-like mini-game with simple levels and improved ghost AI.
+    Controls: W/A/S/D to move, q to quit. Player has a limited number of lives.
+    """
+
+    # Level presets
+    levels = {
+        1: {'rows': 10, 'cols': 20, 'ghosts': 1},
+        2: {'rows': 12, 'cols': 26, 'ghosts': 2},
+        3: {'rows': 14, 'cols': 32, 'ghosts': 3},
+    }
+
+    print("Choose Pacman level (1-easy, 2-medium, 3-hard). Default is 1.")
+    try:
+        lvl = int(prompt("Level: ").strip() or 1)
+        if lvl not in levels:
+            lvl = 1
+    except Exception:
+        lvl = 1
+
+    cfg = levels[lvl]
+    rows, cols = cfg['rows'], cfg['cols']
+    # flat row-major grid: cell (r, c) lives at grid[r*cols + c]
+    grid = bytearray(b'.' * (rows * cols))
+
+    # place walls at borders and a simple inner ring for variety
+    grid[0:cols] = grid[(rows-1)*cols:rows*cols] = b'#' * cols
+    grid[0::cols] = grid[cols-1::cols] = b'#' * rows
+    # inner ring
+    grid[2*cols+2:3*cols-2] = grid[(rows-3)*cols+2:(rows-2)*cols-2] = b'#' * (cols-4)
+
+    # positions are packed grid indices (r*cols + c)
+    start = (rows // 2) * cols + cols // 2
+    player = start
+
+    # place ghosts near corners
+    corners = [(1,1), (1, cols-2), (rows-2, 1), (rows-2, cols-2)]
+    ghosts = [r*cols + c for r, c in corners[:cfg['ghosts']]]
+    ghost_pos = set(ghosts)
+
+    lives = 3
+    score = 0
+
+    def draw():
+        clear_screen()
+        cells = bytearray(grid)
+        for g in ghost_pos:
+            cells[g] = GHOST
+        cells[player] = PLAYER
+        text = cells.decode()
+        frame = [text[r*cols:(r+1)*cols] for r in range(rows)]
+        frame.append(f"Score: {score}  Lives: {lives}")
+        sys.stdout.write("\n".join(frame) + "\n")
+
+    print("Welcome to enhanced Pacman! Eat dots (.) and avoid ghosts (G).")
+    prompt("Press Enter to start...")
+
+    max_turns = 2000
+    # bound once for the ghost AI inner loop
+    rand, sample, _abs = random.random, random.sample, abs
+    turns = 0
+
+    while turns < max_turns and lives > 0:
+        draw()
+        remaining = grid.count(DOT)
+        move = prompt("Move (W/A/S/D, q to quit): ").strip().lower()
+        if move == 'q':
+            print("Exiting Pacman.")
+            break
+        dr = dc = 0
+        if move == 'w': dr = -1
+        elif move == 's': dr = 1
+        elif move == 'a': dc = -1
+        elif move == 'd': dc = 1
+        pr, pc = divmod(player, cols)
+        nr, nc = pr + dr, pc + dc
+        if 0 <= nr < rows and 0 <= nc < cols and grid[nr*cols + nc] != WALL:
+            pr, pc = nr, nc
+            player = nr*cols + nc
+            if grid[player] == DOT:
+                grid[player] = EMPTY
+                score += 1
+
+        # improved ghost AI: greedy toward player but avoid walls and sometimes move randomly
+        for gi, g in enumerate(ghosts):
+            gr, gc = divmod(g, cols)
+            best_move = g
+            best_dist = _abs(gr - pr) + _abs(gc - pc)
+            # random order matters: the tie-break below favours earlier candidates
+            for mr, mc in sample(GHOST_MOVES, 5):
+                cr, cc = gr + mr, gc + mc
+                if 0 <= cr < rows and 0 <= cc < cols and grid[cr*cols + cc] != WALL:
+                    d = _abs(cr - pr) + _abs(cc - pc)
+                    # bias toward lower distance
+                    if d < best_dist or (rand() < 0.15 and d <= best_dist):
+                        best_move = cr*cols + cc
+                        best_dist = d
+            ghosts[gi] = best_move
+        ghost_pos = set(ghosts)
+
+        # collisions
+        if player in ghost_pos:
+            lives -= 1
+            if lives > 0:
+                print("A ghost got you! Lost a life. Respawning...")
+                # reset player to center
+                player = start
+                prompt("Press Enter to continue...")
+                turns += 1
+                continue
+            else:
+                draw()
+                print("Oh no — a ghost caught you and you have no lives left! Game over.")
+                break
+
+        if remaining == 0:
+            draw()
+            print("You cleared all dots — you win this level! Congrats!")
+            break
+
+        turns += 1
+    else:
+        if lives > 0:
+            print("Time's up — thanks for playing!")
+
+
+def run_mario():
+    """A simple terminal 'runner' where Mario jumps over obstacles.
+    Press 'j' then Enter to jump; Enter to tick without jumping. 'q' to quit.
+    """
+    width = 30
+    mario_y = 0  # 0 = on ground, >0 = in air
+    jump_ticks = 0
+    obstacles = 0  # bitset: bit x set means an obstacle at column x
+    score = 0
+    # Mario position is always near left
+    mpos = 2
+    blank = b' ' * width
+    ground = '-' * width
+    line = bytearray(blank)
+    print("Tiny Mario Runner! Press 'j' to jump at a step, 'q' to quit. Survive as long as you can.")
+    prompt("Press Enter to start...")
+    for tick in range(1, 1000):
+        # spawn obstacle occasionally
+        if random.random() < 0.2:
+            obstacles |= 1 << (width - 1)
+
+        # draw
+        clear_screen()
+        line[:] = blank
+        bits = obstacles
+        while bits:
+            low = bits & -bits
+            line[low.bit_length() - 1] = OBSTACLE
+            bits ^= low
+        line[mpos] = MARIO if mario_y == 0 else MARIO_AIR
+        sys.stdout.write(f"{line.decode()}\n{ground}\nScore: {score}\n")
+        cmd = prompt("Step (j=jump, q=quit, Enter=wait): ").strip().lower()
+        if cmd == 'q':
+            print("Quitting Mario. Thanks for playing!")
+            break
+        if cmd == 'j' and mario_y == 0:
+            jump_ticks = 2
+            mario_y = 1
+
+        # update obstacles
+        obstacles >>= 1
+
+        # update jump state
+        if jump_ticks > 0:
+            jump_ticks -= 1
+            if jump_ticks == 0:
+                mario_y = 0
+
+        # check collision
+        if obstacles & (1 << mpos) and mario_y == 0:
+            clear_screen()
+            print(line.decode())
+            print("Oh no — you hit an obstacle! Game over.")
+            break
+
+        score += 1
+        time.sleep(0.05)
+
+
+# Pop quiz key spaces; a name's position is its index into QUIZ_BANKS
+QUIZ_SUBJECTS = ('math', 'science', 'history')
+QUIZ_GRADES = ('primary', 'secondary')
+QUIZ_DIFFICULTIES = ('easy', 'medium', 'hard')
+
+# Pop quiz question bank: QUIZ_BANKS[subject_id][grade_id][difficulty_id] -> tuple of (q, opts, ans, expl)
+QUIZ_BANKS = (
+    (  # math
+        (  # primary
+            (  # easy
+                ("2 + 3 = ?", ['3','4','5','6'], 2, "Add the two numbers: 2+3=5."),
+                ("Which is even?", ['3','7','8','5'], 2, "Even numbers are divisible by 2."),
+            ),
+            (  # medium
+                ("What is 7 * 6?", ['42','36','48','40'], 0, "Multiply: 7 times 6 is 42."),
+                ("Solve 2x+3=7. x = ?", ['1','2','3','4'], 1, "2x = 4, so x = 2."),
+            ),
+            (  # hard
+                ("What is 12*12?", ['144','154','124','124'], 0, "12 times 12 is 144."),
+            ),
+        ),
+        (  # secondary
+            (  # easy
+                ("What is 5*6?", ['11','30','56','20'], 1, "5 times 6 is 30."),
+            ),
+            (  # medium
+                ("Solve 3x - 4 = 11. x = ?", ['3','5','2','4'], 1, "3x = 15, x = 5."),
+            ),
+            (  # hard
+                ("What is the derivative of x^2?", ['2x','x','x^2','1'], 0, "d/dx x^2 = 2x."),
+            ),
+        ),
+    ),
+    (  # science
+        (  # primary
+            (  # easy
+                ("What do plants need to grow?", ['Sun','Sugar','Plastic','Iron'], 0, "Plants need sunlight, water and nutrients."),
+            ),
+            (  # medium
+                ("Which gas do plants produce during photosynthesis?", ['Oxygen','Carbon Dioxide','Nitrogen','Helium'], 0, "Plants release oxygen as a byproduct."),
+            ),
+            (  # hard
+                ("What is the primary pigment used in photosynthesis?", ['Chlorophyll','Carotene','Melanin','Hemoglobin'], 0, "Chlorophyll captures light energy."),
+            ),
+        ),
+        (  # secondary
+            (  # easy
+                ("Water boils at what Celsius temperature?", ['90','100','110','120'], 1, "Water boils at 100°C at sea level."),
+            ),
+            (  # medium
+                ("What is the chemical symbol for water?", ['H2O','HO2','O2H','HHO'], 0, "Water has two hydrogens and one oxygen: H2O."),
+            ),
+            (  # hard
+                ("Which balances the pH in a buffer solution?", ['Acid/base pair','Salt','Sugar','Water'], 0, "Buffers use a conjugate acid/base pair."),
+            ),
+        ),
+    ),
+    (  # history
+        (  # primary
+            (  # easy
+                ("Who discovered America?", ['Columbus','Einstein','Newton','Gutenberg'], 0, "Christopher Columbus reached the Americas in 1492."),
+            ),
+            (  # medium
+                ("Which ancient civilization built pyramids in Egypt?", ['Romans','Egyptians','Greeks','Aztecs'], 1, "The Egyptians built the pyramids."),
+            ),
+            (  # hard
+                ("What year did the Berlin Wall fall?", ['1989','1991','1980','1979'], 0, "The Berlin Wall fell in 1989."),
+            ),
+        ),
+        (  # secondary
+            (  # easy
+                ("In which year did WW2 end?", ['1945','1939','1918','1960'], 0, "World War II ended in 1945."),
+            ),
+            (  # medium
+                ("Who was the first President of the United States?", ['Lincoln','Washington','Jefferson','Adams'], 1, "George Washington was the first president."),
+            ),
+            (  # hard
+                ("Which treaty ended WW1?", ['Versailles','Paris','Vienna','Geneva'], 0, "The Treaty of Versailles ended WWI."),
+            ),
+        ),
+    ),
+)
+
+
+def run_pop_quiz():
+    """Run an expanded pop quiz with subject, grade, and adaptive difficulty.
+
+    Features:
+    - Multiple subjects, grade levels and difficulty tiers (easy/medium/hard)
+    - Adaptive difficulty: if the user does well the quiz offers harder questions next
+    - Explanations after incorrect answers and tailored study tips
+    """
+
+    print("Welcome to the Pop Quiz & Tutor!")
+    subject = input("Choose a subject (math/science/history): ").strip().lower()
+    if subject not in QUIZ_SUBJECTS:
+        print("Subject not available. Returning to menu.")
+        return
+    grade = input("Choose grade level (primary/secondary): ").strip().lower()
+    if grade not in QUIZ_GRADES:
+        print("Grade level not available for this subject. Returning to menu.")
+        return
+    # resolve the chosen names to indices once
+    bank = QUIZ_BANKS[QUIZ_SUBJECTS.index(subject)][QUIZ_GRADES.index(grade)]
+
+    # Ask how many questions
+    try:
+        qcount = int(input("How many questions would you like? (default 3): ").strip() or 3)
+        qcount = max(1, min(10, qcount))
+    except Exception:
+        qcount = 3
+
+    # Start at medium difficulty and adapt
+    cur_idx = 1  # start at medium
+
+    def pick_questions(diff_idx, n):
+        pool = bank[diff_idx]
+        return random.sample(pool, min(n, len(pool)))
+
+    total_correct = 0
+    total_asked = 0
+
+    for round_num in range(1, 3 + 1):  # allow up to 3 adaptive rounds (user can stop early)
+        diff_idx = max(0, min(len(QUIZ_DIFFICULTIES)-1, cur_idx))
+        diff = QUIZ_DIFFICULTIES[diff_idx]
+        questions = pick_questions(diff_idx, qcount)
+        if not questions:
+            print(f"No questions available at {diff} difficulty — trying another level.")
+            # try to find any available
+            found = False
+            for d_idx, pool in enumerate(bank):
+                if pool:
+                    questions = pick_questions(d_idx, qcount)
+                    found = True
+                    break
+            if not found:
+                print("No questions available for this subject/grade. Returning to menu.")
+                return
+
+        correct = 0
+        for i, (q, opts, ans, expl) in enumerate(questions, 1):
+            print(f"\n[Difficulty: {diff}] Question {i}: {q}")
+            for idx, opt in enumerate(opts):
+                print(f"  {idx+1}. {opt}")
+            try:
+                pick = int(input("Your answer (1-4): ").strip()) - 1
+            except Exception:
+                pick = -1
+            if pick == ans:
+                print("Correct! ✅")
+                correct += 1
+            else:
+                print(f"Incorrect. Explanation: {expl}")
+
+        # Round results
+        round_pct = int(100 * correct / len(questions))
+        print(f"\nRound score: {correct}/{len(questions)} ({round_pct}%) at {diff} difficulty.")
+        total_correct += correct
+        total_asked += len(questions)
+
+        # Adaptive adjustment
+        if round_pct >= 80 and cur_idx < len(QUIZ_DIFFICULTIES)-1:
+            print("Great — you performed well. I'll try a harder level next round.")
+            cur_idx += 1
+        elif round_pct < 50 and cur_idx > 0:
+            print("Let's try an easier level to build confidence and fundamentals.")
+            cur_idx -= 1
+        else:
+            print("Maintaining current difficulty for the next round.")
+
+        # Ask if user wants another round (unless we've already done multiple)
+        if round_num < 3:
+            again = input("Do you want another round to continue learning? (y/n): ").strip().lower()
+            if again != 'y':
+                break
+
+    # Final results and tailored teaching
+    score_pct = int(100 * total_correct / total_asked) if total_asked else 0
+    print(f"\nFinal score: {total_correct}/{total_asked} ({score_pct}%).")
+
+    if score_pct >= 80:
+        print("Excellent! You're ready for more challenging topics in this subject.")
+        print("Tip: Try higher difficulty questions or explore applied problems.")
+    elif score_pct >= 50:
+        print("Good job — you have the basics. Review the explanations above and try again.")
+    else:
+        print("No problem — let's strengthen the fundamentals. A few suggestions:")
+        if subject == 'math':
+            print(" - Practice arithmetic and show each step when solving problems.")
+            print(" - Use online exercises for repeated practice on basic operations.")
+        elif subject == 'science':
+            print(" - Review simple definitions and watch short demo videos for concepts.")
+        elif subject == 'history':
+            print(" - Create a timeline of main events and read short summaries to reinforce facts.")
+
+    print("Thanks for using the Pop Quiz & Tutor — repeat quizzes anytime to improve!")